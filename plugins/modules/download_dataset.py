@@ -50,28 +50,37 @@ message:
     sample: "Dataset downloaded successfully to /usr/local/datasets"
 '''
 
-from ansible.module_utils.basic import AnsibleModule
-import datahugger
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 import os
 
+_DOT_TABLE = str.maketrans('.', '_')
+
 def download_dataset(module):
     dataset_url = module.params['dataset_url']
     output_dir = module.params['output_dir']
-    dataset_name = dataset_url.split('/')[-1].replace('.', '_')
-    dataset_path = os.path.join(output_dir, dataset_name)
 
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    # Imported here so loading the module does not pay for datahugger's imports
+    try:
+        import datahugger
+    except ImportError:
+        module.fail_json(msg=missing_required_lib('datahugger'))
+
+    dataset_name = os.path.basename(dataset_url).translate(_DOT_TABLE)
+    dataset_path = os.path.join(output_dir, dataset_name)
 
-    if os.path.exists(dataset_path):
+    # Creates output_dir if needed and fails if the dataset is already there
+    try:
+        os.makedirs(dataset_path)
+    except FileExistsError:
         result = {
             'changed': False,
             'msg': f"Dataset already exists at {dataset_path}"
         }
         module.exit_json(**result)
+    except OSError as e:
+        module.fail_json(msg=f"Failed to create dataset directory: {e}")
 
     try:
-        os.makedirs(dataset_path, exist_ok=True)
         # Download dataset using datahugger
         datahugger.get(dataset_url, dataset_path)
         result = {